@@ -1,117 +1,128 @@
 from __future__ import annotations
 
 import asyncio
-from collections import defaultdict
-from dataclasses import dataclass, field
+from bisect import insort
+from collections import deque
+from dataclasses import dataclass, replace
+from enum import IntEnum
+import functools
+import importlib.util
+import sys
 import time
 import threading
-from typing import Callable, Dict, Iterable, List, Optional
+from typing import Deque, Dict, Iterable, List, Optional, Tuple
 
-import pytest
-from _pytest.outcomes import Exit
 from rich.text import Text
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Container, Horizontal, Vertical
 from textual.screen import ModalScreen
 from textual.widgets import DataTable, Footer, Header, Log, ProgressBar, Static, Button
-
-
-@dataclass
+from textual.widgets.data_table import RowKey
+
+from runner import DashboardPlugin, decode_event, runner_command  # noqa: F401 - DashboardPlugin re-exported
+
+# Only look xdist up; it is loaded by the pytest worker process, not here.
+_HAS_XDIST = importlib.util.find_spec("xdist") is not None
+
+# Upper bound on queued-but-unhandled events between pytest and the UI.
+_EVENT_QUEUE_SIZE = 4096
+# Most events handled before the progress bar/summary are refreshed.
+_MAX_EVENT_BATCH = 512
+# Minimum gap between progress/summary refreshes while results stream in.
+_SUMMARY_INTERVAL = 0.05
+# Last lines of the worker's stderr shown when it exits without finishing.
+_STDERR_TAIL_LINES = 40
+# Longest single event line accepted from the pytest worker.
+_EVENT_LINE_LIMIT = 16 * 1024 * 1024
+# Seconds a stopped worker gets to wind down before it is killed.
+_STOP_GRACE_PERIOD = 5.0
+# Seconds the consumer gets to process the stop sentinel before it is cancelled.
+_CONSUMER_STOP_TIMEOUT = 1.0
+# Trailing traceback lines shown per failure in the details pane.
+_MAX_DETAIL_LINES = 500
+# Failures that keep their traceback; older ones keep only their table row.
+_MAX_STORED_TRACEBACKS = 5000
+# Lines kept in the run log; older ones scroll away for good.
+_MAX_LOG_LINES = 20_000
+# (label, style) pairs for the summary line, in display order.
+_SUMMARY_LABELS = (
+    ("Passed", "green"),
+    ("Failed", "red"),
+    ("Skipped", "yellow"),
+    ("Progress", "cyan"),
+    ("Elapsed", "magenta"),
+    ("ETA", "blue"),
+    ("Coverage", "white"),
+)
+
+
+class Outcome(IntEnum):
+    """Index of each counted test outcome in ``TestDashboardApp.status_counts``."""
+
+    PASSED = 0
+    FAILED = 1
+    ERROR = 2
+    SKIPPED = 3
+
+
+_OUTCOME_IDX = {outcome.name.lower(): outcome for outcome in Outcome}
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_seconds(seconds: int) -> str:
+    # Keyed on whole seconds so the summary's elapsed/ETA values mostly hit.
+    hours, remainder = divmod(seconds, 3600)
+    minutes, secs = divmod(remainder, 60)
+    if hours:
+        return f"{hours}h{minutes:02d}m{secs:02d}s"
+    if minutes:
+        return f"{minutes}m{secs:02d}s"
+    return f"{secs}s"
+
+
+@dataclass(frozen=True)
 class PytestConfig:
-    """Simple container for pytest options we expose in the dashboard."""
+    """Simple container for pytest options we expose in the dashboard.
 
-    paths: List[str] = field(default_factory=lambda: ["tests"])
+    Frozen so the option suffix for ``build_args`` can be computed once; use
+    ``dataclasses.replace`` to change an option. Sequence options are stored
+    as tuples so the config is hashable and cannot change under the cache.
+    There are deliberately no ``__slots__``: ``cached_property`` stores its
+    value in the instance dict.
+    """
+
+    paths: Tuple[str, ...] = ("tests",)
     keyword: Optional[str] = None
     markers: Optional[str] = None
-    extra: List[str] = field(default_factory=list)
+    extra: Tuple[str, ...] = ()
+    # Worker count for pytest-xdist (an int or "auto"); None runs without xdist.
+    parallel: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        # Accept any iterable (the CLI hands over lists).
+        object.__setattr__(self, "paths", tuple(self.paths))
+        object.__setattr__(self, "extra", tuple(self.extra))
 
     def build_args(self, nodeids: Optional[Iterable[str]] = None) -> List[str]:
         """Construct the pytest CLI arguments for a run."""
-        args: List[str] = []
         selected = list(nodeids or [])
-        args.extend(selected if selected else self.paths)
+        return [*(selected if selected else self.paths), *self._suffix]
+
+    @functools.cached_property
+    def _suffix(self) -> Tuple[str, ...]:
+        """Every argument after the selected paths/nodeids."""
+        args: List[str] = []
         if self.keyword:
             args.extend(["-k", self.keyword])
         if self.markers:
             args.extend(["-m", self.markers])
+        if self.parallel:
+            args.extend(["-n", str(self.parallel)])
         args.extend(self.extra)
         # quiet output keeps logs readable; color helps the Log widget
-        args.extend(["-q", "--color=yes", "-s"])
-        return args
-
-
-class _Emitter:
-    """Helper to push events from pytest threads into the asyncio loop."""
-
-    def __init__(self, queue: asyncio.Queue[Dict]):
-        self.queue = queue
-        self.loop = asyncio.get_running_loop()
-
-    def __call__(self, event: Dict) -> None:
-        self.loop.call_soon_threadsafe(self.queue.put_nowait, event)
-
-
-class DashboardPlugin:
-    """Minimal pytest plugin that streams progress back to the dashboard."""
-
-    def __init__(self, emit: Callable[[Dict], None], stop_event: Optional[threading.Event] = None):
-        self.emit = emit
-        self.stop_event = stop_event or threading.Event()
-
-    def pytest_collection_finish(self, session):
-        self.emit({"type": "collected", "total": len(session.items)})
-
-    def pytest_collectreport(self, report):
-        if report.failed:
-            longrepr = getattr(report, "longreprtext", None) or str(report.longrepr)
-            self.emit(
-                {
-                    "type": "collect_error",
-                    "nodeid": report.nodeid or str(report.fspath),
-                    "longrepr": longrepr,
-                }
-            )
-
-    def pytest_runtest_logstart(self, nodeid, location):
-        self.emit({"type": "start", "nodeid": nodeid, "location": location})
-
-    def pytest_runtest_setup(self, item):
-        if self.stop_event.is_set():
-            raise Exit("Test run stopped by user.")
-
-    def pytest_runtest_logreport(self, report):
-        if report.when != "call":
-            return
-        if self.stop_event.is_set():
-            report.outcome = "skipped"
-            self.emit(
-                {
-                    "type": "result",
-                    "nodeid": report.nodeid,
-                    "outcome": "skipped",
-                    "duration": 0,
-                    "location": report.location,
-                    "longrepr": "Stopped by user",
-                }
-            )
-            raise Exit("Test run stopped by user.")
-        longrepr = None
-        if report.failed:
-            longrepr = getattr(report, "longreprtext", None) or str(report.longrepr)
-        self.emit(
-            {
-                "type": "result",
-                "nodeid": report.nodeid,
-                "outcome": report.outcome,
-                "duration": report.duration,
-                "location": report.location,
-                "longrepr": longrepr,
-            }
-        )
-
-    def pytest_sessionfinish(self, session, exitstatus):
-        self.emit({"type": "finished", "status": exitstatus})
+        args.extend(["-q", "--color=yes"])
+        return tuple(args)
 
 
 class StopModal(ModalScreen[None]):
@@ -216,6 +227,7 @@ class TestDashboardApp(App):
         Binding("s", "rerun_selected", "Rerun selected"),
         Binding("a", "rerun_all", "Run all tests"),
         Binding("x", "stop_run", "Stop run"),
+        Binding("p", "toggle_parallel", "Toggle parallel"),
         Binding("q", "quit", "Quit"),
         Binding("ctrl+q", "quit", "Quit"),
         Binding("escape", "quit", "Quit", show=False),
@@ -224,30 +236,51 @@ class TestDashboardApp(App):
     def __init__(self, config: PytestConfig, **kwargs):
         super().__init__(**kwargs)
         self.config = config
-        self.event_queue: asyncio.Queue[Dict] = asyncio.Queue()
+        self.event_queue: asyncio.Queue[Dict] = asyncio.Queue(maxsize=_EVENT_QUEUE_SIZE)
         self.runner_task: Optional[asyncio.Task] = None
         self.consumer_task: Optional[asyncio.Task] = None
         self.total_collected: Optional[int] = None
         self.completed: int = 0
-        self.status_counts: Dict[str, int] = defaultdict(int)
+        self.status_counts: List[int] = [0] * len(Outcome)
         self.failed_results: Dict[str, Dict] = {}
         self.last_failed_nodeids: List[str] = []
-        self.failure_group_map: Dict[str, List[str]] = {}
+        # Failed nodeids whose traceback is still stored, oldest first.
+        self._traceback_order: Deque[str] = deque()
+        self.failure_group_map: Dict[RowKey, List[str]] = {}
+        self.failure_groups: Dict[str, List[str]] = {}
+        self.failure_group_rows: Dict[str, RowKey] = {}
         self.selected_nodeids: List[str] = []
         
         self.summary_panel = Static(id="summary")
         self.progress_bar = ProgressBar(id="progress")
-        self.log_widget = Log(id="log")
+        self.log_widget = Log(id="log", max_lines=_MAX_LOG_LINES)
         self.fail_table = DataTable(id="failures", zebra_stripes=True)
         self.fail_table.cursor_type = "row"
         self.detail_log = Log(id="detail-log")
         self.help_text = Static(
-            "r = rerun failures · s = rerun selected · a = run all · x = stop run · q = quit. Showing pytest progress in real time.",
+            "r = rerun failures · s = rerun selected · a = run all · x = stop run · p = toggle parallel · q = quit. Showing pytest progress in real time.",
             id="help",
         )
         self.run_started_at: Optional[float] = None
         self.stop_event = threading.Event()
         self.stop_modal: Optional[StopModal] = None
+        self.pytest_process: Optional[asyncio.subprocess.Process] = None
+        # Stopped workers still inside their grace period; killed on exit.
+        self._stopping_processes: List[asyncio.subprocess.Process] = []
+        self._parallel_setting = config.parallel or "auto"
+        self._progress_dirty = False
+        self._failure_seen = False
+        self._last_summary_ts = 0.0
+        self._summary_timer: Optional[asyncio.TimerHandle] = None
+        # Log lines produced by the batch being handled, written in one go.
+        self._pending_log: List[str] = []
+        # The last rendered summary and the (values, extra) it was built from.
+        self._summary_cache: Tuple[Optional[tuple], Optional[Text]] = (None, None)
+        # Hit/miss counts of the summary cache, so tests can catch key churn.
+        self._cache_stats: Dict[str, int] = {
+            "summary_hits": 0,
+            "summary_misses": 0,
+        }
 
     def compose(self) -> ComposeResult:  # type: ignore[override]
         yield Header(show_clock=True)
@@ -275,10 +308,21 @@ class TestDashboardApp(App):
         yield Footer()
 
     async def on_mount(self) -> None:
-        self.fail_table.add_columns("File / Feature", "Count", "Tests")
+        self.fail_table.add_column("File / Feature", key="group")
+        self.fail_table.add_column("Count", key="count")
+        self.fail_table.add_column("Tests", key="tests")
         self._update_summary("Waiting to collect tests…")
         await self.start_new_run()
 
+    def on_unmount(self) -> None:
+        self.stop_event.set()
+        # The grace-period kill timers die with the event loop, so take care
+        # of every worker that may still be running here.
+        for proc in (self.pytest_process, *self._stopping_processes):
+            if proc is not None:
+                self._kill_pytest_process(proc)
+        self._stopping_processes.clear()
+
     async def start_new_run(self, failed_only: bool = False) -> None:
         if self.runner_task and not self.runner_task.done():
             self.log_widget.write_line("A run is already active; ignoring new request.")
@@ -287,15 +331,14 @@ class TestDashboardApp(App):
         # Reset state for a fresh run.
         targets = list(self.last_failed_nodeids) if failed_only else None
         self.failed_results.clear()
-        if not failed_only:
-            self.last_failed_nodeids.clear()
-        self.failure_group_map.clear()
+        self.last_failed_nodeids.clear()
+        self._traceback_order.clear()
         self.selected_nodeids = []
         self.completed = 0
         self.total_collected = None
-        self.status_counts = defaultdict(int)
+        self.status_counts = [0] * len(Outcome)
         self.log_widget.clear()
-        self.fail_table.clear()
+        self._reset_failures()
         self.detail_log.clear()
         self.progress_bar.update(total=None, progress=0)
         context = "failed tests" if failed_only else "full suite"
@@ -305,141 +348,354 @@ class TestDashboardApp(App):
         self.stop_event.clear()
 
         # Spin up event handling and pytest worker.
-        self.event_queue = asyncio.Queue()
-        emitter = _Emitter(self.event_queue)
+        self.event_queue = asyncio.Queue(maxsize=_EVENT_QUEUE_SIZE)
 
         async def consume() -> None:
             await self._consume_events()
 
         async def worker() -> None:
-            await asyncio.to_thread(self._run_pytest, emitter, targets, self.stop_event)
+            await self._run_pytest(targets)
 
         self.consumer_task = asyncio.create_task(consume())
         self.runner_task = asyncio.create_task(worker())
 
-    def _run_pytest(
-        self, emit: _Emitter, nodeids: Optional[List[str]], stop_event: Optional[threading.Event] = None
-    ) -> None:
+    async def _run_pytest(self, nodeids: Optional[List[str]]) -> None:
+        """Run pytest in a worker process and feed its events to the consumer."""
         args = self.config.build_args(nodeids)
-        plugin = DashboardPlugin(emit, stop_event or self.stop_event)
-        emit({"type": "args", "args": args})
-        pytest.main(args, plugins=[plugin])
+        self.log_widget.write_line(f"pytest {' '.join(args)}")
+        # A fresh process per run also means edited tests and conftests are
+        # re-imported on every rerun.
+        proc = await asyncio.create_subprocess_exec(
+            *runner_command(),
+            *args,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            limit=_EVENT_LINE_LIMIT,
+        )
+        self.pytest_process = proc
+        # pytest's terminal output and anything printed before pytest starts
+        # (interpreter or import errors) arrive here; keep the tail in case
+        # the worker dies without a finished event.
+        stderr_tail: Deque[bytes] = deque(maxlen=_STDERR_TAIL_LINES)
+        stderr_task = None
+        if proc.stderr is not None:
+            stderr_task = asyncio.create_task(self._collect_stderr(proc.stderr, stderr_tail))
+        finished = False
+        returncode = None
+        try:
+            finished = await self._forward_worker_events(proc.stdout)
+            returncode = await proc.wait()
+        except Exception as exc:
+            # Whatever went wrong, the consumer must still hear the run ended.
+            self.log_widget.write_line(f"[!] Lost the pytest worker's event stream: {exc!r}")
+            self._kill_pytest_process(proc)
+            returncode = await proc.wait()
+        finally:
+            self.pytest_process = None
+            if not self.stop_event.is_set():
+                # A stopped worker gets its grace period from _stop_pytest_process.
+                self._kill_pytest_process(proc)
+            if stderr_task is not None and returncode is None:
+                stderr_task.cancel()
+        if stderr_task is not None:
+            try:
+                await asyncio.wait_for(stderr_task, _CONSUMER_STOP_TIMEOUT)
+            except asyncio.TimeoutError:
+                # Something else still holds the pipe open; the tail so far will do.
+                pass
+        if not finished and not self.stop_event.is_set():
+            # The worker died before pytest finished the session.
+            if stderr_tail:
+                self.log_widget.write_line(f"[!] pytest worker exited with status {returncode}; its last output:")
+                self.log_widget.write_lines(
+                    "  " + Text.from_ansi(line.decode("utf-8", "replace").rstrip()).plain for line in stderr_tail
+                )
+            await self.event_queue.put({"type": "finished", "status": returncode})
+
+    @staticmethod
+    async def _collect_stderr(stream: asyncio.StreamReader, tail: Deque[bytes]) -> None:
+        while True:
+            try:
+                line = await stream.readline()
+            except ValueError:
+                continue
+            if not line:
+                return
+            tail.append(line)
+
+    async def _forward_worker_events(self, stream: asyncio.StreamReader) -> bool:
+        """Queue the worker's events; returns True if its finished event was seen."""
+        finished = False
+        while True:
+            try:
+                line = await stream.readline()
+            except ValueError:
+                # Longer than _EVENT_LINE_LIMIT; the reader has dropped it.
+                self.log_widget.write_line("[!] Skipped an oversized event from the pytest worker.")
+                continue
+            if not line:
+                return finished
+            if self.stop_event.is_set():
+                # The consumer has already been told the run stopped.
+                continue
+            try:
+                event = decode_event(line)
+            except ValueError:
+                # Malformed JSON, or JSON that is not a worker event.
+                continue
+            finished = finished or event.get("type") == "finished"
+            try:
+                self.event_queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # Only a backed-up consumer costs a suspension.
+                await self.event_queue.put(event)
 
     async def _consume_events(self) -> None:
         while True:
-            event = await self.event_queue.get()
-            event_type = event.get("type")
-            if event_type == "collected":
-                self.total_collected = int(event.get("total", 0))
-                self.progress_bar.update(total=float(self.total_collected), progress=0)
-                self._update_summary("Collected tests, running…")
-                self.log_widget.write_line(f"Collected {self.total_collected} tests.")
-            elif event_type == "start":
-                self.log_widget.write_line(f"▶ {event.get('nodeid')}")
-            elif event_type == "result":
-                await self._handle_result(event)
-            elif event_type == "collect_error":
-                nodeid = event.get("nodeid", "collection")
-                longrepr = event.get("longrepr", "")
-                self.log_widget.write_line(f"[!] Collection error in {nodeid}")
-                self.failed_results[nodeid] = {
+            if await self._handle_batch(await self._drain_queue()):
+                return
+
+    async def _drain_queue(self) -> List[Dict]:
+        """Wait for one event, then take whatever else is already queued."""
+        batch = [await self.event_queue.get()]
+        try:
+            while len(batch) < _MAX_EVENT_BATCH:
+                batch.append(self.event_queue.get_nowait())
+        except asyncio.QueueEmpty:
+            pass
+        return batch
+
+    async def _handle_batch(self, batch: List[Dict]) -> bool:
+        """Apply a batch of events, refreshing progress widgets once at the end.
+
+        Returns True once the run's finished event has been handled.
+        """
+        try:
+            for event in batch:
+                if await self._dispatch_event(event):
+                    return True
+        finally:
+            self._flush_log()
+        self._refresh_progress(now=time.monotonic())
+        return False
+
+    def _flush_log(self) -> None:
+        if self._pending_log:
+            self.log_widget.write_lines(self._pending_log)
+            self._pending_log = []
+
+    async def _dispatch_event(self, event: Dict) -> bool:
+        """Apply a single event to the UI; returns True once the run is finished."""
+        event_type = event.get("type")
+        if event_type == "collected":
+            self.total_collected = int(event.get("total", 0))
+            self.progress_bar.update(total=float(self.total_collected), progress=0)
+            self._update_summary("Collected tests, running…")
+            self._pending_log.append(f"Collected {self.total_collected} tests.")
+        elif event_type == "start":
+            self._pending_log.append(f"▶ {event.get('nodeid')}")
+        elif event_type == "result":
+            self._record_result(event)
+        elif event_type == "collect_error":
+            nodeid = event.get("nodeid", "collection")
+            longrepr = event.get("longrepr", "")
+            self._pending_log.append(f"[!] Collection error in {nodeid}")
+            self._record_failure(
+                nodeid,
+                {
                     "nodeid": nodeid,
                     "outcome": "failed",
                     "longrepr": longrepr,
-                }
-                self._refresh_failures()
-            elif event_type == "args":
-                args = " ".join(event.get("args", []))
-                self.log_widget.write_line(f"pytest {args}")
-            elif event_type == "finished":
-                status = event.get("status")
-                if not self.failed_results:
-                    self.last_failed_nodeids.clear()
-                if status == "stopped":
-                    summary = "Run stopped by user."
-                elif status is not None:
-                    summary = f"Run complete (exit status {status})."
-                else:
-                    summary = "Run complete."
-                self._update_summary(summary)
-                self.log_widget.write_line(summary)
-                return
-
-    async def _handle_result(self, event: Dict) -> None:
+                },
+            )
+        elif event_type == "finished":
+            self._refresh_progress(force=True)
+            status = event.get("status")
+            if not self.failed_results:
+                self.last_failed_nodeids.clear()
+            if status == "stopped":
+                summary = "Run stopped by user."
+            elif status is not None:
+                summary = f"Run complete (exit status {status})."
+            else:
+                summary = "Run complete."
+            self._update_summary(summary)
+            self._pending_log.append(summary)
+            return True
+        return False
+
+    def _record_result(self, event: Dict) -> None:
+        """Book-keep a single result; widgets and the log are updated once per batch."""
         nodeid = str(event.get("nodeid"))
         outcome = str(event.get("outcome"))
         self.completed += 1
-        self.status_counts[outcome] += 1
-        progress_target = float(self.total_collected or max(self.completed, 1))
-        self.progress_bar.update(total=progress_target, progress=float(self.completed))
+        idx = _OUTCOME_IDX.get(outcome)
+        if idx is not None:
+            self.status_counts[idx] += 1
+        self._progress_dirty = True
         duration_ms = float(event.get("duration", 0.0)) * 1000
-        msg = f"{nodeid} [{outcome}] ({duration_ms:.1f} ms)"
-        self.log_widget.write_line(msg)
+        self._pending_log.append(f"{nodeid} [{outcome}] ({duration_ms:.1f} ms)")
+        self._pending_log.extend(f"  {line}" for line in event.get("output") or ())
 
         if outcome in {"failed", "error"}:
-            self.failed_results[nodeid] = event
-            self.last_failed_nodeids = list(self.failed_results.keys())
-            self._refresh_failures()
-        self._update_summary()
-
-    def _refresh_failures(self) -> None:
-        grouped: Dict[str, List[str]] = defaultdict(list)
-        group_nodeids: Dict[str, List[str]] = defaultdict(list)
-        for nodeid in self.failed_results:
-            parts = nodeid.split("::")
-            file_part = parts[0]
-            feature = parts[1] if len(parts) > 1 else parts[0]
-            group_key = f"{file_part} :: {feature}"
-            grouped[group_key].append("::".join(parts[1:]) or parts[0])
-            group_nodeids[group_key].append(nodeid)
+            self._record_failure(nodeid, event)
+            self._failure_seen = True
+
+    def _refresh_progress(self, now: Optional[float] = None, force: bool = False) -> None:
+        """Push pending result counts to the widgets, at most once per ``_SUMMARY_INTERVAL``."""
+        if not self._progress_dirty:
+            return
+        now = time.monotonic() if now is None else now
+        since_last = now - self._last_summary_ts
+        if force or self._failure_seen or since_last >= _SUMMARY_INTERVAL:
+            self._flush_progress(now)
+        elif self._summary_timer is None:
+            # Make sure the last results of a burst still reach the widgets.
+            self._summary_timer = asyncio.get_running_loop().call_later(
+                _SUMMARY_INTERVAL - since_last, self._flush_progress
+            )
 
+    def _flush_progress(self, now: Optional[float] = None) -> None:
+        self._progress_dirty = False
+        self._failure_seen = False
+        progress_target = float(self.total_collected or max(self.completed, 1))
+        self.progress_bar.update(total=progress_target, progress=float(self.completed))
+        self._update_summary(now=now)
+
+    def _record_failure(self, nodeid: str, event: Dict) -> None:
+        """Store a failure and fold it into the failures table incrementally."""
+        is_new = nodeid not in self.failed_results
+        # Captured output is already in the log; don't keep it alive for
+        # every failure of a long run.
+        event.pop("output", None)
+        self.failed_results[nodeid] = event
+        if not is_new:
+            # A re-reported failure brings a fresh traceback; it becomes the
+            # most recent one rather than keeping its first-seen place.
+            try:
+                self._traceback_order.remove(nodeid)
+            except ValueError:
+                pass
+        self._traceback_order.append(nodeid)
+        if len(self._traceback_order) > _MAX_STORED_TRACEBACKS:
+            self._drop_traceback(self._traceback_order.popleft())
+        if is_new:
+            self.last_failed_nodeids.append(nodeid)
+            self._add_failure_row(nodeid)
+
+    def _drop_traceback(self, nodeid: str) -> None:
+        # The nodeid stays failed (and rerunnable); only the bulky text goes.
+        result = self.failed_results[nodeid]
+        result.pop("_longrepr_lines", None)
+        result["longrepr"] = f"Traceback dropped; only the last {_MAX_STORED_TRACEBACKS} failures keep theirs."
+
+    def _reset_failures(self) -> None:
+        """Empty the failures table and its lookups; rows are added per failure."""
         self.fail_table.clear()
         self.failure_group_map.clear()
-        first_row_key = None
-        for group, tests in grouped.items():
-            compact = ", ".join(sorted(tests))
-            row_key = self.fail_table.add_row(group, str(len(tests)), compact)
-            if first_row_key is None:
-                first_row_key = row_key
-            self.failure_group_map[row_key] = group_nodeids[group]
-
-        # Auto-populate details with the first row if present.
-        if first_row_key is not None:
-            self._update_failure_details(first_row_key)
-
-    def _summary_text(self, extra: str = "") -> Text:
-        passed = self.status_counts.get("passed", 0)
-        failed = self.status_counts.get("failed", 0) + self.status_counts.get(
-            "error", 0
-        )
-        skipped = self.status_counts.get("skipped", 0)
+        self.failure_groups.clear()
+        self.failure_group_rows.clear()
+
+    def _failure_labels(self, nodeid: str) -> Tuple[str, str]:
+        """Return the (group, test label) pair shown for a failed nodeid."""
+        # Parse the nodeid once and keep the result on the stored event.
+        event = self.failed_results[nodeid]
+        if "_group_key" not in event:
+            path, sep, tail = nodeid.partition("::")
+            feature = tail.partition("::")[0] if sep else path
+            # Interned so every failure in a group shares one key object.
+            event["_group_key"] = sys.intern(f"{path} :: {feature}")
+            event["_test_label"] = tail or path
+        return event["_group_key"], event["_test_label"]
+
+    def _add_failure_row(self, nodeid: str) -> None:
+        group_key, test_label = self._failure_labels(nodeid)
+
+        row_key = self.failure_group_rows.get(group_key)
+        if row_key is None:
+            self.failure_groups[group_key] = [test_label]
+            row_key = self.fail_table.add_row(group_key, "1", test_label)
+            self.failure_group_rows[group_key] = row_key
+            self.failure_group_map[row_key] = [nodeid]
+            # Auto-populate details when the first row appears.
+            if len(self.failure_group_rows) == 1:
+                self._update_failure_details(row_key)
+            return
+
+        tests = self.failure_groups[group_key]
+        insort(tests, test_label)
+        self.failure_group_map[row_key].append(nodeid)
+        self.fail_table.update_cell(row_key, "count", str(len(tests)))
+        self.fail_table.update_cell(row_key, "tests", ", ".join(tests), update_width=True)
+
+    def _summary_text(self, extra: str = "", now: Optional[float] = None) -> Text:
+        """Render the summary, reusing the previous ``Text`` if nothing changed."""
+        key = (self._summary_values(now), extra)
+        cached_key, text = self._summary_cache
+        if key == cached_key:
+            self._cache_stats["summary_hits"] += 1
+            return text
+        self._cache_stats["summary_misses"] += 1
+        text = self._render_summary(*key)
+        self._summary_cache = (key, text)
+        return text
+
+    def _summary_values(self, now: Optional[float] = None) -> tuple:
+        """The displayed summary values, in ``_SUMMARY_LABELS`` order."""
+        counts = self.status_counts
+        passed = counts[Outcome.PASSED]
+        failed = counts[Outcome.FAILED] + counts[Outcome.ERROR]
+        skipped = counts[Outcome.SKIPPED]
         total_display = self.total_collected if self.total_collected is not None else "?"
-        elapsed = self._format_duration(time.monotonic() - self.run_started_at) if self.run_started_at else "0s"
+        elapsed_seconds = 0.0
+        if self.run_started_at:
+            elapsed_seconds = (time.monotonic() if now is None else now) - self.run_started_at
+        elapsed = self._format_duration(elapsed_seconds) if self.run_started_at else "0s"
         eta_display = "…"
         if self.run_started_at and self.total_collected and self.completed > 0:
             remaining = max(self.total_collected - self.completed, 0)
-            rate = (time.monotonic() - self.run_started_at) / max(self.completed, 1)
+            rate = elapsed_seconds / max(self.completed, 1)
             eta_seconds = remaining * rate
             eta_display = self._format_duration(eta_seconds)
         coverage_display = "?"
         if self.total_collected and self.total_collected > 0:
             coverage_percent = (passed / self.total_collected) * 100
             coverage_display = f"{coverage_percent:.0f}%"
-        base = (
-            f"[green]Passed[/]: {passed}   "
-            f"[red]Failed[/]: {failed}   "
-            f"[yellow]Skipped[/]: {skipped}   "
-            f"[cyan]Progress[/]: {self.completed}/{total_display}   "
-            f"[magenta]Elapsed[/]: {elapsed}   "
-            f"[blue]ETA[/]: {eta_display}   "
-            f"[white]Coverage[/]: {coverage_display}"
+        return (
+            passed,
+            failed,
+            skipped,
+            f"{self.completed}/{total_display}",
+            elapsed,
+            eta_display,
+            coverage_display,
         )
-        if extra:
-            base = f"{base}\n{extra}"
-        return Text.from_markup(base)
 
-    def _update_summary(self, extra: str = "") -> None:
-        self.summary_panel.update(self._summary_text(extra))
+    @staticmethod
+    def _render_summary(values: tuple, extra: str) -> Text:
+        # Assemble pre-styled segments directly; no markup parsing per refresh.
+        segments: List = []
+        for (label, style), value in zip(_SUMMARY_LABELS, values):
+            if segments:
+                segments.append("   ")
+            segments.append((label, style))
+            segments.append(f": {value}")
+        if extra:
+            segments.append(f"\n{extra}")
+        return Text.assemble(*segments)
+
+    def _update_summary(self, extra: str = "", now: Optional[float] = None) -> None:
+        if self._summary_timer is not None:
+            self._summary_timer.cancel()
+            self._summary_timer = None
+        now = time.monotonic() if now is None else now
+        self._last_summary_ts = now
+        # Skip the widget refresh when nothing visible would change.
+        previous = self._summary_cache[1]
+        text = self._summary_text(extra, now)
+        if text is not previous:
+            self.summary_panel.update(text)
 
     async def action_rerun_failed(self) -> None:
         if not self.last_failed_nodeids:
@@ -458,6 +714,16 @@ class TestDashboardApp(App):
     async def action_rerun_all(self) -> None:
         await self.start_new_run(failed_only=False)
 
+    def action_toggle_parallel(self) -> None:
+        if not _HAS_XDIST:
+            self.log_widget.write_line("Parallel runs need pytest-xdist: pip install pytest-xdist")
+            return
+        self.config = replace(self.config, parallel=None if self.config.parallel else self._parallel_setting)
+        if self.config.parallel:
+            self.log_widget.write_line(f"Parallel mode on (-n {self.config.parallel}); applies to the next run.")
+        else:
+            self.log_widget.write_line("Parallel mode off; applies to the next run.")
+
     def _update_failure_details(self, row_key) -> None:
         nodeids = self.failure_group_map.get(row_key, [])
         self.selected_nodeids = nodeids
@@ -465,15 +731,26 @@ class TestDashboardApp(App):
         if not nodeids:
             self.detail_log.write_line("No details available for this row.")
             return
+        lines: List[str] = []
         for nodeid in nodeids:
-            self.detail_log.write_line(f"[bold]{nodeid}[/]")
+            lines.append(f"[bold]{nodeid}[/]")
             result = self.failed_results.get(nodeid, {})
+            lines.extend(self._longrepr_lines(result) or ["No traceback recorded."])
+            lines.append("-" * 40)
+        self.detail_log.write_lines(lines)
+
+    @staticmethod
+    def _longrepr_lines(result: Dict) -> List[str]:
+        """Split a failure's traceback once, keeping only its last lines."""
+        lines = result.get("_longrepr_lines")
+        if lines is None:
             longrepr = result.get("longrepr")
-            if longrepr:
-                self.detail_log.write_line(str(longrepr))
-            else:
-                self.detail_log.write_line("No traceback recorded.")
-            self.detail_log.write_line("-" * 40)
+            lines = str(longrepr).splitlines() if longrepr else []
+            if len(lines) > _MAX_DETAIL_LINES:
+                omitted = len(lines) - _MAX_DETAIL_LINES
+                lines = [f"… {omitted} earlier lines omitted", *lines[-_MAX_DETAIL_LINES:]]
+            result["_longrepr_lines"] = lines
+        return lines
 
     def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
         self._update_failure_details(event.row_key)
@@ -486,6 +763,7 @@ class TestDashboardApp(App):
             self.log_widget.write_line("No active run to stop.")
             return
         self.stop_event.set()
+        self._stop_pytest_process()
         self._clear_event_queue()
         self.log_widget.write_line("Stop requested; attempting to cancel current run…")
         self._update_summary("Stopping run…")
@@ -493,14 +771,52 @@ class TestDashboardApp(App):
             self.event_queue.put_nowait({"type": "finished", "status": "stopped"})
         except asyncio.QueueFull:
             pass
+        await self._reap_run_tasks()
         await self._show_stop_modal()
 
+    async def _reap_run_tasks(self) -> None:
+        """Let the consumer handle the stop sentinel, then make sure both run tasks are gone."""
+        consumer, runner = self.consumer_task, self.runner_task
+        self.consumer_task = self.runner_task = None
+        tasks = [task for task in (consumer, runner) if task is not None]
+        if consumer is not None:
+            await asyncio.wait([consumer], timeout=_CONSUMER_STOP_TIMEOUT)
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+        # The worker process is left to the kill timer set by _stop_pytest_process.
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _stop_pytest_process(self) -> None:
+        proc = self.pytest_process
+        if proc is None or proc.returncode is not None:
+            return
+        # Closing stdin asks the worker to stop after the current test; kill it
+        # if it is stuck (e.g. in a hanging test) past the grace period.
+        if proc.stdin is not None:
+            proc.stdin.close()
+        # Cancelling the runner task drops pytest_process; keep our own reference.
+        self._stopping_processes = [p for p in self._stopping_processes if p.returncode is None]
+        self._stopping_processes.append(proc)
+        asyncio.get_running_loop().call_later(_STOP_GRACE_PERIOD, self._kill_pytest_process, proc)
+
+    @staticmethod
+    def _kill_pytest_process(proc: asyncio.subprocess.Process) -> None:
+        if proc.returncode is None:
+            try:
+                proc.kill()
+            except ProcessLookupError:
+                pass
+
     def _clear_event_queue(self) -> None:
+        # Drain in place: the consumer may be parked in get() on this queue
+        # and must still receive the "finished" sentinel queued next. Going
+        # through get_nowait() also wakes a producer blocked on a full queue.
         try:
             while True:
                 self.event_queue.get_nowait()
         except asyncio.QueueEmpty:
-            return
+            pass
 
     async def _show_stop_modal(self) -> None:
         if self.stop_modal and self.stop_modal.is_running:
@@ -510,11 +826,4 @@ class TestDashboardApp(App):
 
     @staticmethod
     def _format_duration(seconds: float) -> str:
-        seconds = max(0, int(seconds))
-        hours, remainder = divmod(seconds, 3600)
-        minutes, secs = divmod(remainder, 60)
-        if hours:
-            return f"{hours}h{minutes:02d}m{secs:02d}s"
-        if minutes:
-            return f"{minutes}m{secs:02d}s"
-        return f"{secs}s"
+        return _format_seconds(max(0, int(seconds)))
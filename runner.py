@@ -0,0 +1,206 @@
+"""pytest side of the dashboard: the reporting plugin and the worker process.
+
+The dashboard runs pytest in a child process (``python runner.py <args>``)
+so test code never competes with the UI for the GIL. The child writes one
+event per line to its stdout as a JSON array, ``[type code, *fields]``
+(encoded with orjson when it is installed); everything pytest itself prints
+goes to stderr. Closing the child's stdin asks it to stop after the current
+test.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+import sys
+import threading
+from typing import BinaryIO, Callable, Dict, List, Optional, Sequence
+
+import pytest
+from _pytest.outcomes import Exit
+
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ModuleNotFoundError:  # pragma: no cover - optional speedup
+    orjson = None
+    _HAS_ORJSON = False
+
+# Frozen (PyInstaller) builds re-launch their own executable with this flag.
+WORKER_ARG = "--pytest-worker"
+# Captured stdout/stderr lines forwarded to the log per test result.
+_MAX_CAPTURED_LINES = 200
+
+# Event type codes: ``EVENT_TYPES[code]`` is the type name the dashboard sees.
+EVENT_TYPES = ("collected", "collect_error", "start", "result", "finished")
+COLLECTED, COLLECT_ERROR, START, RESULT, FINISHED = range(len(EVENT_TYPES))
+# Positional fields of each event type, so field names never go over the pipe.
+_EVENT_FIELDS = (
+    ("total",),
+    ("nodeid", "longrepr"),
+    ("nodeid", "location"),
+    ("nodeid", "outcome", "duration", "location", "longrepr", "output"),
+    ("status",),
+)
+
+
+class DashboardPlugin:
+    """Minimal pytest plugin that streams progress back to the dashboard.
+
+    Events go to ``emit_event(type_code, *fields)``, with fields in
+    ``_EVENT_FIELDS`` order; wrap a dict callback with ``dict_emitter``.
+    """
+
+    # Read on every hook call.
+    __slots__ = ("emit_event", "stop_event", "_collected_sent")
+
+    def __init__(self, emit_event: Callable[..., None], stop_event: Optional[threading.Event] = None):
+        self.emit_event = emit_event
+        self.stop_event = stop_event or threading.Event()
+        self._collected_sent = False
+
+    def pytest_collection_finish(self, session):
+        self._collected_sent = True
+        self.emit_event(COLLECTED, len(session.items))
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_xdist_node_collection_finished(self, node, ids):
+        # Under xdist only the workers collect; they all see the same items,
+        # so the first report stands in for pytest_collection_finish.
+        if self._collected_sent:
+            return
+        self._collected_sent = True
+        self.emit_event(COLLECTED, len(ids))
+
+    def pytest_collectreport(self, report):
+        if report.failed:
+            longrepr = getattr(report, "longreprtext", None) or str(report.longrepr)
+            self.emit_event(COLLECT_ERROR, report.nodeid or str(report.fspath), longrepr)
+
+    def pytest_runtest_logstart(self, nodeid, location):
+        self.emit_event(START, nodeid, location)
+
+    def pytest_runtest_setup(self, item):
+        if self.stop_event.is_set():
+            raise Exit("Test run stopped by user.")
+
+    def pytest_runtest_logreport(self, report):
+        if report.when != "call":
+            return
+        if self.stop_event.is_set():
+            report.outcome = "skipped"
+            self.emit_event(RESULT, report.nodeid, "skipped", 0, report.location, "Stopped by user", [])
+            raise Exit("Test run stopped by user.")
+        longrepr = None
+        if report.failed:
+            longrepr = getattr(report, "longreprtext", None) or str(report.longrepr)
+        self.emit_event(
+            RESULT,
+            report.nodeid,
+            report.outcome,
+            report.duration,
+            report.location,
+            longrepr,
+            self._captured_lines(report),
+        )
+
+    @staticmethod
+    def _captured_lines(report) -> List[str]:
+        """Return the tail of a report's captured stdout/stderr."""
+        lines: List[str] = []
+        for captured in (getattr(report, "capstdout", ""), getattr(report, "capstderr", "")):
+            if captured:
+                lines.extend(captured.splitlines())
+        return lines[-_MAX_CAPTURED_LINES:]
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        self.emit_event(FINISHED, exitstatus)
+
+
+def runner_command() -> List[str]:
+    """Command prefix that starts a worker; pytest args are appended to it."""
+    if getattr(sys, "frozen", False):
+        return [sys.executable, WORKER_ARG]
+    return [sys.executable, str(Path(__file__).resolve())]
+
+
+def event_dict(code: int, fields: Sequence) -> Dict:
+    """Build the dict form of an event, as the dashboard handles it."""
+    event = dict(zip(_EVENT_FIELDS[code], fields))
+    event["type"] = EVENT_TYPES[code]
+    return event
+
+
+def dict_emitter(callback: Callable[[Dict], None]) -> Callable[..., None]:
+    """Adapt a callback taking event dicts to ``DashboardPlugin``'s emit_event."""
+
+    def emit_event(code: int, *fields) -> None:
+        callback(event_dict(code, fields))
+
+    return emit_event
+
+
+def _encode_event(code: int, fields: Sequence) -> bytes:
+    if _HAS_ORJSON:
+        return orjson.dumps([code, *fields], option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps([code, *fields]) + "\n").encode("utf-8")
+
+
+def decode_event(line: bytes) -> Dict:
+    """Parse one event line written by a worker into its dict form.
+
+    Raises ``ValueError`` (``json.JSONDecodeError`` for malformed JSON, with
+    either backend) when the line is not a worker event.
+    """
+    raw = orjson.loads(line) if _HAS_ORJSON else json.loads(line)
+    if not (
+        isinstance(raw, list)
+        and raw
+        and type(raw[0]) is int
+        and 0 <= raw[0] < len(EVENT_TYPES)
+        and len(raw) == len(_EVENT_FIELDS[raw[0]]) + 1
+    ):
+        raise ValueError(f"not a worker event: {line[:80]!r}")
+    return event_dict(raw[0], raw[1:])
+
+
+def _event_writer(stream: BinaryIO) -> Callable[..., None]:
+    # Flush every event: a result in particular must not wait in the buffer
+    # through its test's fixture teardown.
+    def emit_event(code: int, *fields) -> None:
+        stream.write(_encode_event(code, fields))
+        stream.flush()
+
+    return emit_event
+
+
+def _watch_for_stop(fd: int, stop_event: threading.Event) -> None:
+    # Any input, or EOF when the dashboard closes the pipe (or goes away),
+    # means stop.
+    try:
+        os.read(fd, 1)
+    except OSError:
+        pass
+    stop_event.set()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run pytest with ``DashboardPlugin`` streaming events to stdout."""
+    args = list(sys.argv[1:] if argv is None else argv)
+    # Keep the real stdout for events only and point fd 1 at stderr, so
+    # pytest's own output cannot interleave with the event stream. Our
+    # private copies of stdin/stdout are also out of reach of fd capture.
+    events = os.fdopen(os.dup(sys.stdout.fileno()), "wb")
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+    stop_event = threading.Event()
+    threading.Thread(
+        target=_watch_for_stop, args=(os.dup(sys.stdin.fileno()), stop_event), daemon=True
+    ).start()
+    plugin = DashboardPlugin(_event_writer(events), stop_event)
+    return int(pytest.main(args, plugins=[plugin]))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
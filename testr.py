@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
+import sys
 from typing import Dict, List, Optional
 
 import typer
@@ -17,6 +19,14 @@ except ModuleNotFoundError:  # pragma: no cover - runtime import guard
     trogon_tui = None
     _HAS_TROGON = False
 
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ModuleNotFoundError:  # pragma: no cover - optional speedup
+    orjson = None
+    _HAS_ORJSON = False
+
 
 @typer_app.command()
 def dashboard(
@@ -34,6 +44,13 @@ def dashboard(
         "--extra",
         help="Additional raw pytest args (e.g. --maxfail=1 --lf).",
     ),
+    parallel: Optional[str] = typer.Option(
+        None,
+        "-n",
+        "--parallel",
+        help="Run tests across workers with pytest-xdist (a number or 'auto').",
+        show_default=False,
+    ),
     use_last: bool = typer.Option(
         False,
         "--use-last",
@@ -52,7 +69,7 @@ def dashboard(
 ) -> None:
     """Launch the live pytest dashboard."""
     paths = paths or ["tests"]
-    from dashboard import PytestConfig, TestDashboardApp
+    from dashboard import _HAS_XDIST, PytestConfig, TestDashboardApp
 
     if forget_last:
         _clear_last_run()
@@ -65,14 +82,21 @@ def dashboard(
             keyword = saved.get("keyword", keyword)
             markers = saved.get("markers", markers)
             extra = saved.get("extra", extra)
+            parallel = saved.get("parallel", parallel)
             typer.echo("Reusing saved filters/paths from the last run.")
         else:
             typer.echo("No saved filters found; running with provided/default values.")
 
-    config = PytestConfig(paths=paths, keyword=keyword, markers=markers, extra=extra)
+    if parallel and not _HAS_XDIST:
+        typer.echo("pytest-xdist is not installed. Install it to use --parallel:\n  pip install pytest-xdist", err=True)
+        raise typer.Exit(code=1)
+
+    config = PytestConfig(paths=paths, keyword=keyword, markers=markers, extra=extra, parallel=parallel)
 
     if save_last:
-        _save_last_run({"paths": paths, "keyword": keyword, "markers": markers, "extra": extra})
+        _save_last_run(
+            {"paths": paths, "keyword": keyword, "markers": markers, "extra": extra, "parallel": parallel}
+        )
 
     TestDashboardApp(config).run()
 
@@ -80,16 +104,41 @@ def dashboard(
 _STATE_FILE = Path(__file__).resolve().parent / ".testr_last_run.json"
 
 
+def _dump_state(data: Dict) -> bytes:
+    if _HAS_ORJSON:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(data, indent=2, sort_keys=True).encode("utf-8")
+
+
+def _load_state(raw: bytes) -> Dict:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+    # handle both backends the same way.
+    if _HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 def _save_last_run(data: Dict) -> None:
+    payload = _dump_state(data)
     try:
-        _STATE_FILE.write_text(json.dumps(data, indent=2))
-    except OSError as exc:  # pragma: no cover - defensive guard
+        if _STATE_FILE.read_bytes() == payload:
+            return
+    except OSError:
+        pass
+    # Write to a sibling temp file and swap it in so an interrupted save
+    # never leaves a truncated state file behind.
+    tmp_file = _STATE_FILE.with_suffix(".json.tmp")
+    try:
+        tmp_file.write_bytes(payload)
+        os.replace(tmp_file, _STATE_FILE)
+    except OSError as exc:
+        tmp_file.unlink(missing_ok=True)
         typer.echo(f"Warning: failed to save last run config: {exc}", err=True)
 
 
 def _load_last_run() -> Optional[Dict]:
     try:
-        return json.loads(_STATE_FILE.read_text())
+        return _load_state(_STATE_FILE.read_bytes())
     except FileNotFoundError:
         return None
     except (OSError, json.JSONDecodeError) as exc:  # pragma: no cover - defensive guard
@@ -123,6 +172,13 @@ if _HAS_TROGON:
 
 
 def main() -> None:
+    # A frozen build has no separate interpreter for the pytest worker, so the
+    # dashboard re-launches this executable with runner.WORKER_ARG instead.
+    if getattr(sys, "frozen", False):
+        import runner
+
+        if sys.argv[1:2] == [runner.WORKER_ARG]:
+            sys.exit(runner.main(sys.argv[2:]))
     click_app()
 
 
@@ -7,19 +7,25 @@ import pytest
 
 from dashboard import (
     DashboardPlugin,
+    Outcome,
     PytestConfig,
     TestDashboardApp,
-    _Emitter,
 )
+from runner import COLLECTED, EVENT_TYPES, FINISHED, START, _encode_event, dict_emitter
 
 
 class FakeLog:
     def __init__(self) -> None:
         self.lines: List[str] = []
+        self.writes = 0
 
     def write_line(self, line: str, scroll_end=None):  # signature compat
         self.lines.append(line)
 
+    def write_lines(self, lines, scroll_end=None):
+        self.writes += 1
+        self.lines.extend(lines)
+
     def clear(self):
         self.lines.clear()
 
@@ -33,23 +39,65 @@ class FakeProgress:
 
 
 class FakeTable:
+    COLUMNS = ("group", "count", "tests")
+
     def __init__(self) -> None:
         self.rows: List[tuple] = []
+        self.keys: List[str] = []
         self.cursor_type = None
 
     def clear(self):
         self.rows.clear()
+        self.keys.clear()
 
     def add_row(self, *args, **kwargs):
         key = kwargs.get("key", f"row{len(self.rows)}")
         self.rows.append(args)
+        self.keys.append(key)
         return key
 
+    def update_cell(self, row_key, column_key, value, update_width=False):
+        index = self.keys.index(row_key)
+        row = list(self.rows[index])
+        row[self.COLUMNS.index(column_key)] = value
+        self.rows[index] = tuple(row)
+
     def add_columns(self, *args, **kwargs):
         # no-op for tests
         return None
 
 
+class FakeStream:
+    """Stand-in for an asyncio StreamReader; exceptions in ``items`` are raised."""
+
+    def __init__(self, items) -> None:
+        self._items = iter(items)
+
+    async def readline(self) -> bytes:
+        item = next(self._items, b"")
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+
+class FakeProcess:
+    def __init__(self, stdout_items, returncode: int = 0) -> None:
+        self.stdin = None
+        self.stdout = FakeStream(stdout_items)
+        self.stderr = None
+        self.returncode = None
+        self.killed = False
+        self._exit_code = returncode
+
+    def kill(self) -> None:
+        self.killed = True
+        self._exit_code = -9
+
+    async def wait(self) -> int:
+        self.returncode = self._exit_code
+        return self._exit_code
+
+
 class FakeSummary:
     def __init__(self) -> None:
         self.last = None
@@ -74,9 +122,44 @@ def test_pytest_config_respects_overrides():
     assert "--maxfail=1" in args
 
 
+def test_pytest_config_is_hashable_and_immutable():
+    extra = ["--maxfail=1"]
+    cfg = PytestConfig(paths=["pkg"], extra=extra)
+    assert cfg.paths == ("pkg",) and cfg.extra == ("--maxfail=1",)
+    assert hash(cfg) == hash(PytestConfig(paths=("pkg",), extra=("--maxfail=1",)))
+    cfg.build_args()
+    extra.append("-x")
+    assert "-x" not in cfg.build_args()
+
+
+def test_pytest_config_adds_xdist_workers_when_parallel():
+    assert "-n" not in PytestConfig().build_args()
+    args = PytestConfig(parallel="auto").build_args()
+    assert args[args.index("-n") + 1] == "auto"
+
+
+def test_dashboard_app_toggle_parallel_rebuilds_args(monkeypatch):
+    monkeypatch.setattr("dashboard._HAS_XDIST", True)
+    app = TestDashboardApp(PytestConfig(paths=["tests"]))
+    app.log_widget = FakeLog()
+    assert "-n" not in app.config.build_args()
+    app.action_toggle_parallel()
+    assert app.config.build_args()[-4:-2] == ["-n", "auto"]
+    app.action_toggle_parallel()
+    assert "-n" not in app.config.build_args()
+
+
+def test_dashboard_plugin_reports_xdist_collection_once():
+    seen = []
+    plugin = DashboardPlugin(dict_emitter(seen.append))
+    plugin.pytest_xdist_node_collection_finished(node=None, ids=["a", "b"])
+    plugin.pytest_xdist_node_collection_finished(node=None, ids=["a", "b"])
+    assert seen == [{"type": "collected", "total": 2}]
+
+
 def test_dashboard_plugin_emits_expected_events():
     seen = []
-    plugin = DashboardPlugin(emit=seen.append)
+    plugin = DashboardPlugin(lambda *event: seen.append(event))
 
     class Report:
         def __init__(self, failed=False):
@@ -96,32 +179,97 @@ def test_dashboard_plugin_emits_expected_events():
     plugin.pytest_runtest_logreport(Report(failed=True))
     plugin.pytest_sessionfinish(None, 0)
 
-    event_types = [e["type"] for e in seen]
+    event_types = [EVENT_TYPES[code] for code, *_ in seen]
     assert event_types == ["collected", "collect_error", "start", "result", "finished"]
 
 
-@pytest.mark.asyncio
-async def test_emitter_pushes_events_into_queue():
-    q: asyncio.Queue[Dict] = asyncio.Queue()
-    emitter = _Emitter(q)
-    emitter({"type": "ping"})
-    event = await asyncio.wait_for(q.get(), timeout=1)
-    assert event["type"] == "ping"
+def test_dashboard_plugin_forwards_captured_output():
+    seen = []
+    plugin = DashboardPlugin(dict_emitter(seen.append))
 
+    class Report:
+        nodeid = "node::test"
+        outcome = "passed"
+        failed = False
+        duration = 0.1
+        location = ("node.py", 1, "test")
+        when = "call"
+        capstdout = "hello\nworld\n"
+        capstderr = "warn\n"
+
+    plugin.pytest_runtest_logreport(Report())
+    assert seen[0]["output"] == ["hello", "world", "warn"]
 
-def test_dashboard_app_refresh_failures_groups_by_file():
+
+def test_dashboard_app_failures_table_groups_by_file():
     app = TestDashboardApp(PytestConfig(paths=["tests"]))
     app.fail_table = FakeTable()
     app.detail_log = FakeLog()
-    app.failed_results = {
-        "pkg/test_a.py::feature::case1": {},
-        "pkg/test_a.py::feature::case2": {},
-        "pkg/test_b.py::case3": {},
-    }
-    app._refresh_failures()
+    for nodeid in ("pkg/test_a.py::feature::case1", "pkg/test_a.py::feature::case2", "pkg/test_b.py::case3"):
+        app._record_failure(nodeid, {})
     rows = sorted(app.fail_table.rows)
     assert ("pkg/test_a.py :: feature", "2", "feature::case1, feature::case2") in rows
     assert ("pkg/test_b.py :: case3", "1", "case3") in rows
+    assert app.failed_results["pkg/test_b.py::case3"]["_group_key"] == "pkg/test_b.py :: case3"
+    assert app.selected_nodeids == ["pkg/test_a.py::feature::case1", "pkg/test_a.py::feature::case2"]
+    case1, case2 = (app.failed_results[f"pkg/test_a.py::feature::{case}"] for case in ("case1", "case2"))
+    assert case1["_group_key"] is case2["_group_key"]
+
+    app._reset_failures()
+    assert app.fail_table.rows == []
+    assert not (app.failure_group_map or app.failure_groups or app.failure_group_rows)
+
+
+@pytest.mark.asyncio
+async def test_dashboard_app_handle_result_updates_failure_rows_in_place():
+    app = TestDashboardApp(PytestConfig(paths=["tests"]))
+    app.progress_bar = FakeProgress()
+    app.log_widget = FakeLog()
+    app.summary_panel = FakeSummary()
+    app.fail_table = FakeTable()
+    app.detail_log = FakeLog()
+
+    await app._handle_batch(
+        [
+            {"type": "result", "nodeid": nodeid, "outcome": "failed", "longrepr": "boom"}
+            for nodeid in ("pkg/test_a.py::feature::case2", "pkg/test_a.py::feature::case1", "pkg/test_b.py::case3")
+        ]
+    )
+
+    assert app.fail_table.rows == [
+        ("pkg/test_a.py :: feature", "2", "feature::case1, feature::case2"),
+        ("pkg/test_b.py :: case3", "1", "case3"),
+    ]
+    assert app.selected_nodeids == ["pkg/test_a.py::feature::case2", "pkg/test_a.py::feature::case1"]
+
+
+def test_dashboard_app_caps_stored_tracebacks(monkeypatch):
+    monkeypatch.setattr("dashboard._MAX_STORED_TRACEBACKS", 2)
+    app = TestDashboardApp(PytestConfig(paths=["tests"]))
+    app.fail_table = FakeTable()
+    app.detail_log = FakeLog()
+    for case in ("case1", "case2", "case3"):
+        app._record_failure(f"pkg/test_a.py::{case}", {"longrepr": f"{case} boom"})
+
+    assert app.last_failed_nodeids == ["pkg/test_a.py::case1", "pkg/test_a.py::case2", "pkg/test_a.py::case3"]
+    assert len(app.fail_table.rows) == 3
+    assert app.failed_results["pkg/test_a.py::case1"]["longrepr"].startswith("Traceback dropped")
+    assert app.failed_results["pkg/test_a.py::case3"]["longrepr"] == "case3 boom"
+
+
+def test_dashboard_app_re_reported_failure_keeps_newest_traceback(monkeypatch):
+    monkeypatch.setattr("dashboard._MAX_STORED_TRACEBACKS", 2)
+    app = TestDashboardApp(PytestConfig(paths=["tests"]))
+    app.fail_table = FakeTable()
+    app.detail_log = FakeLog()
+    for case in ("case1", "case2", "case1", "case3"):
+        app._record_failure(f"pkg/test_a.py::{case}", {"longrepr": f"{case} boom"})
+
+    assert app.last_failed_nodeids == ["pkg/test_a.py::case1", "pkg/test_a.py::case2", "pkg/test_a.py::case3"]
+    assert len(app.fail_table.rows) == 3
+    assert app.failed_results["pkg/test_a.py::case1"]["longrepr"] == "case1 boom"
+    assert app.failed_results["pkg/test_a.py::case2"]["longrepr"].startswith("Traceback dropped")
+    assert list(app._traceback_order) == ["pkg/test_a.py::case1", "pkg/test_a.py::case3"]
 
 
 @pytest.mark.asyncio
@@ -134,36 +282,227 @@ async def test_dashboard_app_handle_result_tracks_progress():
     app.detail_log = FakeLog()
     app.total_collected = 2
 
-    await app._handle_result(
-        {
-            "nodeid": "pkg/test_mod.py::test_one",
-            "outcome": "passed",
-            "duration": 0.05,
-            "location": ("pkg/test_mod.py", 1, "test_one"),
-        }
+    await app._handle_batch(
+        [
+            {
+                "type": "result",
+                "nodeid": "pkg/test_mod.py::test_one",
+                "outcome": "passed",
+                "duration": 0.05,
+                "location": ("pkg/test_mod.py", 1, "test_one"),
+            }
+        ]
     )
     assert app.completed == 1
-    assert app.status_counts["passed"] == 1
+    assert app.status_counts[Outcome.PASSED] == 1
     assert app.failed_results == {}
 
-    await app._handle_result(
-        {
-            "nodeid": "pkg/test_mod.py::test_two",
-            "outcome": "failed",
-            "duration": 0.1,
-            "location": ("pkg/test_mod.py", 2, "test_two"),
-            "longrepr": "boom",
-        }
+    await app._handle_batch(
+        [
+            {
+                "type": "result",
+                "nodeid": "pkg/test_mod.py::test_two",
+                "outcome": "failed",
+                "duration": 0.1,
+                "location": ("pkg/test_mod.py", 2, "test_two"),
+                "longrepr": "boom",
+                "output": ["captured"],
+            }
+        ]
     )
     assert app.completed == 2
-    assert app.status_counts["failed"] == 1
+    assert app.log_widget.lines[-1] == "  captured"
+    assert "output" not in app.failed_results["pkg/test_mod.py::test_two"]
+    assert app.status_counts[Outcome.FAILED] == 1
     assert app.last_failed_nodeids == ["pkg/test_mod.py::test_two"]
     assert ("total" in app.progress_bar.calls[-1] and "progress" in app.progress_bar.calls[-1])
 
 
+@pytest.mark.asyncio
+async def test_dashboard_app_handle_batch_updates_progress_once():
+    app = TestDashboardApp(PytestConfig(paths=["tests"]))
+    app.progress_bar = FakeProgress()
+    app.log_widget = FakeLog()
+    app.summary_panel = FakeSummary()
+    app.total_collected = 3
+    batch = [{"type": "start", "nodeid": "t1"}]
+    batch += [{"type": "result", "nodeid": f"t{index}", "outcome": "passed"} for index in range(3)]
+
+    assert await app._handle_batch(batch) is False
+    assert app.completed == 3
+    assert app.progress_bar.calls == [{"total": 3.0, "progress": 3.0}]
+    assert app.log_widget.lines[0] == "▶ t1"
+    assert len(app.log_widget.lines) == 4
+    assert app.log_widget.writes == 1
+
+
+@pytest.mark.asyncio
+async def test_dashboard_app_rate_limits_progress_updates(monkeypatch):
+    clock = [100.0]
+    scheduled = []
+
+    class FakeHandle:
+        def cancel(self):
+            pass
+
+    class FakeLoop:
+        def call_later(self, delay, callback):
+            scheduled.append((delay, callback))
+            return FakeHandle()
+
+    monkeypatch.setattr("dashboard.time.monotonic", lambda: clock[0])
+    monkeypatch.setattr("dashboard.asyncio.get_running_loop", FakeLoop)
+    app = TestDashboardApp(PytestConfig(paths=["tests"]))
+    app.progress_bar = FakeProgress()
+    app.log_widget = FakeLog()
+    app.summary_panel = FakeSummary()
+    app.total_collected = 3
+
+    for index in range(3):
+        await app._handle_batch([{"type": "result", "nodeid": f"t{index}", "outcome": "passed"}])
+        clock[0] += 0.01
+    assert app.progress_bar.calls == [{"total": 3.0, "progress": 1.0}]
+    assert len(scheduled) == 1
+    delay, flush = scheduled[0]
+    assert 0 < delay <= 0.05
+
+    clock[0] += delay
+    flush()
+    assert app.progress_bar.calls[-1] == {"total": 3.0, "progress": 3.0}
+    assert "3/3" in app.summary_panel.last.plain
+
+
+@pytest.mark.asyncio
+async def test_dashboard_app_clear_event_queue_keeps_consumer_queue():
+    app = TestDashboardApp(PytestConfig(paths=["tests"]))
+    queue = app.event_queue
+    for index in range(10):
+        queue.put_nowait({"type": "start", "nodeid": str(index)})
+    app._clear_event_queue()
+    assert app.event_queue is queue and queue.empty()
+    queue.put_nowait({"type": "finished", "status": "stopped"})
+    assert queue.get_nowait()["status"] == "stopped"
+
+
+@pytest.mark.asyncio
+async def test_dashboard_app_clear_event_queue_wakes_blocked_producer():
+    app = TestDashboardApp(PytestConfig(paths=["tests"]))
+    app.event_queue = queue = asyncio.Queue(maxsize=2)
+    queue.put_nowait({"type": "start", "nodeid": "a"})
+    queue.put_nowait({"type": "start", "nodeid": "b"})
+    producer = asyncio.create_task(queue.put({"type": "start", "nodeid": "c"}))
+    await asyncio.sleep(0)
+    assert not producer.done()
+
+    app._clear_event_queue()
+    queue.put_nowait({"type": "finished", "status": "stopped"})
+    await asyncio.wait_for(producer, timeout=1)
+    assert queue.get_nowait()["status"] == "stopped"
+
+
+@pytest.mark.asyncio
+async def test_dashboard_app_stop_run_reaps_run_tasks(monkeypatch):
+    app = TestDashboardApp(PytestConfig(paths=["tests"]))
+    app.progress_bar = FakeProgress()
+    app.log_widget = FakeLog()
+    app.summary_panel = FakeSummary()
+
+    async def no_modal() -> None:
+        return None
+
+    monkeypatch.setattr(app, "_show_stop_modal", no_modal)
+    runner = asyncio.create_task(asyncio.sleep(60))
+    consumer = asyncio.create_task(app._consume_events())
+    app.runner_task, app.consumer_task = runner, consumer
+
+    await app.action_stop_run()
+    assert consumer.done() and runner.cancelled()
+    assert app.runner_task is None and app.consumer_task is None
+    assert app.log_widget.lines[-1] == "Run stopped by user."
+
+
+@pytest.mark.asyncio
+async def test_dashboard_app_unmount_kills_worker_stopped_in_grace_period(monkeypatch):
+    app = TestDashboardApp(PytestConfig(paths=["tests"]))
+    app.progress_bar = FakeProgress()
+    app.log_widget = FakeLog()
+    app.summary_panel = FakeSummary()
+
+    class FakeStdin:
+        closed = False
+
+        def close(self):
+            self.closed = True
+
+    class FakeProcess:
+        returncode = None
+
+        def __init__(self):
+            self.stdin = FakeStdin()
+            self.killed = False
+
+        def kill(self):
+            self.killed = True
+            self.returncode = -9
+
+    async def no_modal() -> None:
+        return None
+
+    async def hanging_run() -> None:
+        try:
+            await asyncio.sleep(60)
+        finally:
+            app.pytest_process = None
+
+    monkeypatch.setattr(app, "_show_stop_modal", no_modal)
+    proc = FakeProcess()
+    app.pytest_process = proc
+    app.runner_task = asyncio.create_task(hanging_run())
+    app.consumer_task = asyncio.create_task(app._consume_events())
+    await asyncio.sleep(0)
+
+    await app.action_stop_run()
+    assert proc.stdin.closed and not proc.killed
+    assert app.pytest_process is None
+
+    app.on_unmount()
+    assert proc.killed
+
+
+def test_dashboard_app_failure_details_show_traceback_tail():
+    app = TestDashboardApp(PytestConfig(paths=["tests"]))
+    app.fail_table = FakeTable()
+    app.detail_log = FakeLog()
+    longrepr = "\n".join(f"line {index}" for index in range(1000))
+    app._record_failure("pkg/test_a.py::test_deep", {"longrepr": longrepr})
+    assert app.detail_log.lines[0] == "[bold]pkg/test_a.py::test_deep[/]"
+    assert app.detail_log.lines[1] == "… 500 earlier lines omitted"
+    assert app.detail_log.lines[2] == "line 500"
+    assert app.detail_log.lines[-2] == "line 999"
+
+
+def test_dashboard_app_update_summary_skips_unchanged_state():
+    app = TestDashboardApp(PytestConfig(paths=["tests"]))
+    app.summary_panel = FakeSummary()
+    app._update_summary("running")
+    first = app.summary_panel.last
+    app._update_summary("running")
+    assert app.summary_panel.last is first
+    app.completed = 1
+    app._update_summary("running")
+    assert app.summary_panel.last is not first
+
+
+def test_format_duration_formats_whole_seconds():
+    assert TestDashboardApp._format_duration(-1) == "0s"
+    assert TestDashboardApp._format_duration(59.9) == "59s"
+    assert TestDashboardApp._format_duration(61) == "1m01s"
+    assert TestDashboardApp._format_duration(3725) == "1h02m05s"
+
+
 def test_dashboard_app_summary_text_contains_counts():
     app = TestDashboardApp(PytestConfig(paths=["tests"]))
-    app.status_counts = {"passed": 2, "failed": 1, "skipped": 3}
+    app.status_counts = [2, 1, 0, 3]
     app.completed = 4
     app.total_collected = 5
     text = app._summary_text("extra info")
@@ -173,18 +512,104 @@ def test_dashboard_app_summary_text_contains_counts():
     assert "Coverage" in text.plain
     assert "40%" in text.plain
     assert "extra info" in text.plain
+    assert app._summary_text("extra info") is text
+    app.completed = 5
+    assert app._summary_text("extra info") is not text
+    assert app._cache_stats["summary_hits"] == 1
+    assert app._cache_stats["summary_misses"] == 2
 
 
-def test_run_pytest_invokes_pytest_main(monkeypatch):
+@pytest.mark.asyncio
+async def test_run_pytest_streams_worker_events(monkeypatch):
     captured = {}
 
-    def fake_main(args, plugins):
-        captured["args"] = args
-        captured["plugins"] = plugins
-        return 0
+    async def fake_exec(*cmd, **kwargs):
+        captured["cmd"] = cmd
+        return FakeProcess(
+            [
+                _encode_event(COLLECTED, (1,)),
+                b"not json\n",
+                _encode_event(FINISHED, (0,)),
+            ]
+        )
+
+    monkeypatch.setattr("dashboard.asyncio.create_subprocess_exec", fake_exec)
+    app = TestDashboardApp(PytestConfig(paths=["alpha"]))
+    app.log_widget = FakeLog()
+    await app._run_pytest(nodeids=["a::b"])
+    assert "a::b" in captured["cmd"]
+    assert app.log_widget.lines[0].startswith("pytest a::b")
+    events = [app.event_queue.get_nowait() for _ in range(app.event_queue.qsize())]
+    assert [e["type"] for e in events] == ["collected", "finished"]
+    assert app.pytest_process is None
+
+
+@pytest.mark.asyncio
+async def test_run_pytest_reports_worker_crash(monkeypatch):
+    async def fake_exec(*cmd, **kwargs):
+        return FakeProcess([], returncode=3)
+
+    monkeypatch.setattr("dashboard.asyncio.create_subprocess_exec", fake_exec)
+    app = TestDashboardApp(PytestConfig(paths=["alpha"]))
+    app.log_widget = FakeLog()
+    await app._run_pytest(nodeids=None)
+    events = [app.event_queue.get_nowait() for _ in range(app.event_queue.qsize())]
+    assert events[-1] == {"type": "finished", "status": 3}
+
+
+@pytest.mark.asyncio
+async def test_run_pytest_skips_oversized_and_non_object_lines(monkeypatch):
+    async def fake_exec(*cmd, **kwargs):
+        proc = FakeProcess([], returncode=1)
+        proc.stdout = asyncio.StreamReader(limit=64)
+        proc.stdout.feed_data(_encode_event(COLLECTED, (1,)))
+        proc.stdout.feed_data(_encode_event(START, ("x" * 200, None)))
+        proc.stdout.feed_data(b'42\n["not", "an", "event"]\n{"type": "start"}\n')
+        proc.stdout.feed_eof()
+        return proc
+
+    monkeypatch.setattr("dashboard.asyncio.create_subprocess_exec", fake_exec)
+    app = TestDashboardApp(PytestConfig(paths=["alpha"]))
+    app.log_widget = FakeLog()
+    await app._run_pytest(nodeids=None)
+    events = [app.event_queue.get_nowait() for _ in range(app.event_queue.qsize())]
+    assert events == [{"type": "collected", "total": 1}, {"type": "finished", "status": 1}]
+    assert any("oversized" in line for line in app.log_widget.lines)
+
+
+@pytest.mark.asyncio
+async def test_run_pytest_kills_worker_when_stream_fails(monkeypatch):
+    proc = FakeProcess([_encode_event(COLLECTED, (1,)), RuntimeError("pipe broke")])
+
+    async def fake_exec(*cmd, **kwargs):
+        return proc
 
-    monkeypatch.setattr("dashboard.pytest.main", fake_main)
+    monkeypatch.setattr("dashboard.asyncio.create_subprocess_exec", fake_exec)
     app = TestDashboardApp(PytestConfig(paths=["alpha"]))
-    app._run_pytest(emit=lambda _: None, nodeids=["a::b"])
-    assert captured["args"][:1] == ["a::b"]
-    assert captured["plugins"] and hasattr(captured["plugins"][0], "pytest_runtest_logreport")
+    app.log_widget = FakeLog()
+    await app._run_pytest(nodeids=None)
+    events = [app.event_queue.get_nowait() for _ in range(app.event_queue.qsize())]
+    assert proc.killed
+    assert events[-1] == {"type": "finished", "status": -9}
+    assert app.pytest_process is None
+
+
+@pytest.mark.asyncio
+async def test_run_pytest_shows_worker_stderr_when_it_dies(monkeypatch):
+    proc = FakeProcess([], returncode=1)
+    proc.stderr = FakeStream([b"Traceback (most recent call last):\n", b"\x1b[31mImportError: no runner\x1b[0m\n"])
+
+    async def fake_exec(*cmd, **kwargs):
+        assert kwargs["stderr"] == asyncio.subprocess.PIPE
+        return proc
+
+    monkeypatch.setattr("dashboard.asyncio.create_subprocess_exec", fake_exec)
+    app = TestDashboardApp(PytestConfig(paths=["alpha"]))
+    app.log_widget = FakeLog()
+    await app._run_pytest(nodeids=None)
+    assert app.log_widget.lines[-3:] == [
+        "[!] pytest worker exited with status 1; its last output:",
+        "  Traceback (most recent call last):",
+        "  ImportError: no runner",
+    ]
+    assert app.event_queue.get_nowait() == {"type": "finished", "status": 1}
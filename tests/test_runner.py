@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import io
+import json
+import subprocess
+import textwrap
+import time
+from typing import Dict, List
+
+import pytest
+
+from runner import COLLECT_ERROR, COLLECTED, RESULT, START, _encode_event, _event_writer, decode_event, runner_command
+
+
+def _write_tests(tmp_path) -> str:
+    test_file = tmp_path / "test_worker_sample.py"
+    test_file.write_text(
+        textwrap.dedent(
+            """
+            import time
+
+            def test_pass():
+                print("hello")
+
+            def test_fail():
+                assert 1 == 2
+
+            def test_slow():
+                time.sleep(0.3)
+            """
+        )
+    )
+    return str(test_file)
+
+
+def _start_worker(tmp_path, *args: str) -> subprocess.Popen:
+    return subprocess.Popen(
+        [*runner_command(), *args, "-p", "no:cacheprovider"],
+        cwd=tmp_path,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+    )
+
+
+def _read_events(proc: subprocess.Popen) -> List[Dict]:
+    assert proc.stdout is not None
+    events = [decode_event(line) for line in proc.stdout]
+    proc.wait(timeout=30)
+    return events
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_event_codec_round_trips(monkeypatch, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr("runner._HAS_ORJSON", use_orjson)
+    line = _encode_event(RESULT, ("a::ü", "failed", 0.5, ["a.py", 1, "ü"], "boom", ["out"]))
+    assert line.endswith(b"\n") and line.count(b"\n") == 1
+    assert decode_event(line) == {
+        "type": "result",
+        "nodeid": "a::ü",
+        "outcome": "failed",
+        "duration": 0.5,
+        "location": ["a.py", 1, "ü"],
+        "longrepr": "boom",
+        "output": ["out"],
+    }
+    with pytest.raises(json.JSONDecodeError):
+        decode_event(b"not json\n")
+    for not_an_event in (b"42\n", b'{"type": "start"}\n', b"[99]\n", b'[0, 1, "extra"]\n', b"[true, 1]\n"):
+        with pytest.raises(ValueError):
+            decode_event(not_an_event)
+
+
+def test_event_writer_flushes_every_event():
+    class Stream(io.BytesIO):
+        def __init__(self) -> None:
+            super().__init__()
+            self.flushed_at: List[bytes] = []
+
+        def flush(self) -> None:
+            self.flushed_at.append(self.getvalue())
+
+    stream = Stream()
+    emit_event = _event_writer(stream)
+    emit_event(COLLECT_ERROR, "b", "boom")
+    emit_event(COLLECTED, 1)
+    emit_event(START, "a", ["a.py", 0, "a"])
+    assert len(stream.flushed_at) == 3
+    assert [decode_event(line)["type"] for line in stream.flushed_at[-1].splitlines()] == [
+        "collect_error",
+        "collected",
+        "start",
+    ]
+
+
+def test_worker_streams_json_events(tmp_path):
+    proc = _start_worker(tmp_path, _write_tests(tmp_path))
+    events = _read_events(proc)
+    proc.stdin.close()
+
+    assert events[0] == {"type": "collected", "total": 3}
+    results = {e["nodeid"].split("::")[-1]: e for e in events if e["type"] == "result"}
+    assert results["test_pass"]["outcome"] == "passed"
+    assert results["test_pass"]["output"] == ["hello"]
+    assert results["test_fail"]["outcome"] == "failed"
+    assert "assert 1 == 2" in results["test_fail"]["longrepr"]
+    assert events[-1] == {"type": "finished", "status": 1}
+
+
+def test_worker_sends_result_before_slow_teardown(tmp_path):
+    test_file = tmp_path / "test_worker_teardown.py"
+    test_file.write_text(
+        textwrap.dedent(
+            """
+            import time
+
+            import pytest
+
+            @pytest.fixture
+            def slow_teardown():
+                yield
+                time.sleep(1.0)
+
+            def test_a(slow_teardown):
+                pass
+            """
+        )
+    )
+    proc = _start_worker(tmp_path, str(test_file))
+    arrivals = {}
+    for line in proc.stdout:
+        arrivals.setdefault(decode_event(line)["type"], time.monotonic())
+    proc.wait(timeout=30)
+    proc.stdin.close()
+
+    assert arrivals["finished"] - arrivals["result"] >= 0.5
+
+
+def test_worker_stops_when_stdin_closes(tmp_path):
+    proc = _start_worker(tmp_path, _write_tests(tmp_path))
+    proc.stdin.close()
+    events = _read_events(proc)
+
+    assert len([e for e in events if e["type"] == "result"]) < 3
+    assert events[-1]["type"] == "finished"
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+
+import testr
+
+
+def _use_state_file(monkeypatch, tmp_path):
+    state_file = tmp_path / "last_run.json"
+    monkeypatch.setattr("testr._STATE_FILE", state_file)
+    return state_file
+
+
+def test_save_last_run_round_trips(monkeypatch, tmp_path):
+    state_file = _use_state_file(monkeypatch, tmp_path)
+    data = {"paths": ["tests"], "keyword": None, "extra": ["-x"], "parallel": "auto"}
+    testr._save_last_run(data)
+    assert testr._load_last_run() == data
+    assert [path.name for path in tmp_path.iterdir()] == [state_file.name]
+
+
+def test_save_last_run_skips_unchanged_state(monkeypatch, tmp_path):
+    state_file = _use_state_file(monkeypatch, tmp_path)
+    testr._save_last_run({"paths": ["tests"]})
+    writes = []
+    real_replace = os.replace
+
+    def tracking_replace(src, dst):
+        writes.append(dst)
+        real_replace(src, dst)
+
+    monkeypatch.setattr("testr.os.replace", tracking_replace)
+    testr._save_last_run({"paths": ["tests"]})
+    assert writes == []
+    testr._save_last_run({"paths": ["other"]})
+    assert writes == [state_file]
+
+
+def test_save_last_run_keeps_old_state_when_replace_fails(monkeypatch, tmp_path):
+    state_file = _use_state_file(monkeypatch, tmp_path)
+    testr._save_last_run({"paths": ["tests"]})
+    before = state_file.read_bytes()
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr("testr.os.replace", failing_replace)
+    testr._save_last_run({"paths": ["other"]})
+    assert state_file.read_bytes() == before
+    assert [path.name for path in tmp_path.iterdir()] == [state_file.name]
+
+
+def test_state_backends_round_trip_the_same_data(monkeypatch):
+    pytest.importorskip("orjson")
+    data = {"paths": ["tests", "ü"], "keyword": None, "markers": "slow", "extra": [], "parallel": "4"}
+    monkeypatch.setattr("testr._HAS_ORJSON", True)
+    fast = testr._dump_state(data)
+    monkeypatch.setattr("testr._HAS_ORJSON", False)
+    stdlib = testr._dump_state(data)
+
+    assert testr._load_state(fast) == testr._load_state(stdlib) == data
+    monkeypatch.setattr("testr._HAS_ORJSON", True)
+    assert testr._load_state(fast) == testr._load_state(stdlib) == data
+
+
+@pytest.mark.parametrize("use_orjson", [True, False])
+def test_load_last_run_ignores_corrupt_state(monkeypatch, tmp_path, use_orjson):
+    if use_orjson:
+        pytest.importorskip("orjson")
+    monkeypatch.setattr("testr._HAS_ORJSON", use_orjson)
+    state_file = _use_state_file(monkeypatch, tmp_path)
+    state_file.write_bytes(b"{not json")
+    assert testr._load_last_run() is None